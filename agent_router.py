@@ -6,8 +6,10 @@ This module handles intelligent routing of legal queries to appropriate speciali
 based on case type analysis and domain expertise matching.
 """
 
+import asyncio
 import logging
 import re
+import threading
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from specialized_agents import (
@@ -37,7 +39,10 @@ class AgentRouter:
     def __init__(self):
         self.agents = {}
         self.routing_keywords = {}
+        self.routing_patterns = {}
         self.case_statistics = {}
+        # Queries are routed from several executor threads at once
+        self.statistics_lock = threading.Lock()
         self.initialize_agents()
         self.initialize_routing_keywords()
         logger.info("Agent Router initialized with specialized agents")
@@ -130,6 +135,13 @@ class AgentRouter:
                 "obstruction", "public order", "nuisance activities"
             ]
         }
+
+        # One literal alternation per category, so a category none of whose keywords
+        # occur in the query is ruled out with a single scan
+        self.routing_patterns = {
+            category: re.compile("|".join(re.escape(keyword) for keyword in keywords))
+            for category, keywords in self.routing_keywords.items()
+        }
     
     def analyze_query_keywords(self, query: str) -> Dict[CaseCategory, float]:
         """Analyze query and calculate relevance scores for each agent category"""
@@ -140,12 +152,14 @@ class AgentRouter:
             score = 0.0
             matched_keywords = []
             
-            for keyword in keywords:
-                if keyword in query_lower:
-                    # Weight longer keywords more heavily
-                    weight = len(keyword.split()) * 1.5
-                    score += weight
-                    matched_keywords.append(keyword)
+            # Only weigh individual keywords once the category's pattern matches at all
+            if self.routing_patterns[category].search(query_lower) is not None:
+                for keyword in keywords:
+                    if keyword in query_lower:
+                        # Weight longer keywords more heavily
+                        weight = len(keyword.split()) * 1.5
+                        score += weight
+                        matched_keywords.append(keyword)
             
             # Normalize score by query length
             if len(query_lower.split()) > 0:
@@ -153,7 +167,7 @@ class AgentRouter:
             else:
                 scores[category] = 0.0
                 
-            logger.debug(f"{category}: score={scores[category]:.2f}, keywords={matched_keywords}")
+            logger.debug("%s: score=%.2f, keywords=%s", category.value, scores[category], matched_keywords)
         
         return scores
     
@@ -174,8 +188,8 @@ class AgentRouter:
                         break
                 else:
                     # Fallback to keyword matching in case_type
-                    for category, keywords in self.routing_keywords.items():
-                        if any(keyword in case_type_lower for keyword in keywords):
+                    for category, pattern in self.routing_patterns.items():
+                        if pattern.search(case_type_lower):
                             keyword_scores[category] += 2.0  # Boost score for keyword match
             
             # Find best matching agent
@@ -210,50 +224,90 @@ class AgentRouter:
             # Get analysis from selected agent
             analysis = agent.analyze_case(query, case_type or "General Legal Matter")
             
-            # Add routing information
-            analysis["routing_info"] = {
-                "selected_agent": agent.agent_name,
-                "agent_category": category.value,
-                "selection_confidence": confidence,
-                "routing_timestamp": datetime.now().isoformat(),
-                "processing_time": (datetime.now() - start_time).total_seconds()
-            }
-            
-            # Update statistics
-            self.update_routing_statistics(category, True, (datetime.now() - start_time).total_seconds())
-            
-            logger.info(f"Query routed successfully to {agent.agent_name}")
-            return analysis
+            return self._complete_routing(analysis, category, agent, confidence, start_time)
             
         except Exception as e:
-            logger.error(f"Error routing query: {str(e)}")
-            return {
-                "error": f"Routing error: {str(e)}",
-                "routing_info": {
-                    "selected_agent": "Error",
-                    "agent_category": "unknown",
-                    "selection_confidence": 0.0,
-                    "routing_timestamp": datetime.now().isoformat()
-                }
+            return self._routing_error(e)
+
+    async def route_query_async(self, query: str, case_type: str = None) -> Dict[str, Any]:
+        """Route query without blocking the event loop; the agent's NVIDIA call is awaited"""
+        try:
+            start_time = datetime.now()
+            category, agent, confidence = self.select_best_agent(query, case_type)
+            analysis = await agent.analyze_case_async(query, case_type or "General Legal Matter")
+            return self._complete_routing(analysis, category, agent, confidence, start_time)
+        except Exception as e:
+            return self._routing_error(e)
+
+    async def route_queries_async(self, queries: List[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """Route several (query, case_type) pairs concurrently, returning results in submission order"""
+        # Route each distinct query once; repeats in the batch get a copy of its result
+        unique_queries = list(dict.fromkeys(queries))
+        results = dict(zip(unique_queries, await asyncio.gather(*(
+            self.route_query_async(query, case_type) for query, case_type in unique_queries
+        ))))
+        return [dict(results[key]) for key in queries]
+
+    def _complete_routing(self, analysis: Dict[str, Any], category: CaseCategory,
+                          agent: SpecializedLegalAgent, confidence: float,
+                          start_time: datetime) -> Dict[str, Any]:
+        """Attach routing information to an agent's analysis and update statistics"""
+        # Add routing information
+        analysis["routing_info"] = {
+            "selected_agent": agent.agent_name,
+            "agent_category": category.value,
+            "selection_confidence": confidence,
+            "routing_timestamp": datetime.now().isoformat(),
+            "processing_time": (datetime.now() - start_time).total_seconds()
+        }
+        
+        # Update statistics
+        self.update_routing_statistics(category, True, (datetime.now() - start_time).total_seconds())
+        
+        logger.info(f"Query routed successfully to {agent.agent_name}")
+        return analysis
+
+    def _routing_error(self, error: Exception) -> Dict[str, Any]:
+        """Error result returned when routing a query fails"""
+        logger.error(f"Error routing query: {str(error)}")
+        return {
+            "error": f"Routing error: {str(error)}",
+            "routing_info": {
+                "selected_agent": "Error",
+                "agent_category": "unknown",
+                "selection_confidence": 0.0,
+                "routing_timestamp": datetime.now().isoformat()
             }
+        }
+
+    async def analyze_with_agents(self, query: str, categories: List[CaseCategory],
+                                  case_type: str = None) -> Dict[CaseCategory, Dict[str, Any]]:
+        """Analyze one query with several specialized agents concurrently"""
+        case_type = case_type or "General Legal Matter"
+        results = await asyncio.gather(*(
+            self.agents[category].analyze_case_async(query, case_type)
+            for category in categories
+        ))
+        return dict(zip(categories, results))
     
     def update_routing_statistics(self, category: CaseCategory, success: bool, processing_time: float):
         """Update routing and performance statistics"""
         try:
-            stats = self.case_statistics[category]
-            stats["total_cases"] += 1
-            
-            if success:
-                stats["successful_cases"] += 1
-            
-            # Update average processing time
-            total_time = stats["average_processing_time"] * (stats["total_cases"] - 1) + processing_time
-            stats["average_processing_time"] = total_time / stats["total_cases"]
-            
-            # Update success rate
-            stats["success_rate"] = stats["successful_cases"] / stats["total_cases"]
-            
-            logger.debug(f"Updated statistics for {category}: {stats}")
+            with self.statistics_lock:
+                stats = self.case_statistics[category]
+                stats["total_cases"] += 1
+                
+                if success:
+                    stats["successful_cases"] += 1
+                
+                # Update average processing time
+                total_time = stats["average_processing_time"] * (stats["total_cases"] - 1) + processing_time
+                stats["average_processing_time"] = total_time / stats["total_cases"]
+                
+                # Update success rate
+                stats["success_rate"] = stats["successful_cases"] / stats["total_cases"]
+                
+                logger.debug("Updated statistics for %s: %s", category.value, stats)
             
         except Exception as e:
             logger.error(f"Error updating statistics: {str(e)}")
@@ -27,7 +27,8 @@ import time
 # FastAPI and related imports
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, HTMLResponse, JSONResponse, Response
+from fastapi.responses import StreamingResponse, HTMLResponse, JSONResponse, ORJSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field, validator
 
@@ -42,6 +43,13 @@ try:
 except ImportError:
     AI_AVAILABLE = False
 
+# Faster response serialization when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure comprehensive logging first
 logging.basicConfig(
     level=logging.INFO,
@@ -56,7 +64,7 @@ logger = logging.getLogger("BhimLaw_AI")
 # Specialized Agents
 try:
     from agent_router import get_agent_router, AgentRouter
-    from specialized_agents import CaseCategory, SpecializedAgentType
+    from specialized_agents import CaseCategory, SpecializedAgentType, aclose_async_http_client
     SPECIALIZED_AGENTS_AVAILABLE = True
     logger.info("Specialized agents loaded successfully")
 except ImportError as e:
@@ -145,7 +153,8 @@ app = FastAPI(
         "url": "https://bhimlaw.ai/license"
     },
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # Configure CORS for global access
@@ -164,6 +173,12 @@ if LEGAL_ACTS_SYSTEM_AVAILABLE:
 else:
     logger.warning("Legal Acts Management API not available")
 
+@app.on_event("shutdown")
+async def close_specialized_agent_clients():
+    """Close the pooled connections used by async specialized agent calls"""
+    if SPECIALIZED_AGENTS_AVAILABLE:
+        await aclose_async_http_client()
+
 # Logger already configured above
 
 # AI Configuration - Use NVIDIA API (tested and working)
@@ -365,6 +380,10 @@ class SpecializedAgentRequest(BaseModel):
     session_id: Optional[str] = Field(default=None, description="Session ID for conversation continuity")
     force_new_session: bool = Field(default=False, description="Force creation of new session")
 
+class SpecializedBatchRequest(BaseModel):
+    """Request for several specialized agent analyses in one round trip"""
+    items: List[SpecializedAgentRequest] = Field(..., description="Analyses to run", min_length=1, max_length=20)
+
 class AgentRoutingRequest(BaseModel):
     """Request for agent routing recommendations"""
     query: str = Field(..., description="Legal question for routing analysis", min_length=10)
@@ -3169,6 +3188,36 @@ async def test_pdf_generation():
 
 # Specialized Agent Endpoints
 
+def record_specialized_analysis(request: SpecializedAgentRequest, analysis_result: Dict[str, Any]) -> str:
+    """Record a specialized analysis in its conversation session and the global analytics
+
+    Returns the session ID the analysis was recorded under.
+    """
+    # Handle session management
+    if request.force_new_session or not request.session_id or request.session_id not in legal_conversation_states:
+        session_id = bhimlaw_ai.create_new_session(legal_conversation_states)
+    else:
+        session_id = request.session_id
+
+    # Update session data
+    session_data = legal_conversation_states[session_id]
+    session_data["last_updated"] = datetime.now().isoformat()
+    session_data["total_queries"] += 1
+    session_data["conversation_history"].append({
+        "timestamp": datetime.now().isoformat(),
+        "query": request.query,
+        "case_type": request.case_type,
+        "agent_used": analysis_result.get("routing_info", {}).get("selected_agent", "Unknown"),
+        "analysis_type": "specialized_agent"
+    })
+
+    # Update global analytics
+    legal_analytics["total_consultations"] += 1
+    if "error" not in analysis_result:
+        legal_analytics["successful_analyses"] += 1
+
+    return session_id
+
 @app.post("/api/specialized/analyze")
 async def analyze_with_specialized_agent(request: SpecializedAgentRequest):
     """Analyze legal case using specialized agents with intelligent routing"""
@@ -3188,36 +3237,15 @@ async def analyze_with_specialized_agent(request: SpecializedAgentRequest):
         # Get agent router
         router = get_agent_router()
 
-        # Handle session management
-        if request.force_new_session or not request.session_id or request.session_id not in legal_conversation_states:
-            session_id = bhimlaw_ai.create_new_session(legal_conversation_states)
-        else:
-            session_id = request.session_id
+        # Route query to appropriate specialized agent without blocking the event loop
+        analysis_result = await router.route_query_async(request.query, request.case_type)
 
-        # Route query to appropriate specialized agent
-        analysis_result = router.route_query(request.query, request.case_type)
-
-        # Update session data
-        session_data = legal_conversation_states[session_id]
-        session_data["last_updated"] = datetime.now().isoformat()
-        session_data["total_queries"] += 1
-        session_data["conversation_history"].append({
-            "timestamp": datetime.now().isoformat(),
-            "query": request.query,
-            "case_type": request.case_type,
-            "agent_used": analysis_result.get("routing_info", {}).get("selected_agent", "Unknown"),
-            "analysis_type": "specialized_agent"
-        })
+        # Record the analysis in its session and the global analytics
+        session_id = record_specialized_analysis(request, analysis_result)
 
         # Calculate processing time
         processing_time = (datetime.now() - start_time).total_seconds()
 
-        # Update global analytics
-        global legal_analytics
-        legal_analytics["total_consultations"] += 1
-        if "error" not in analysis_result:
-            legal_analytics["successful_analyses"] += 1
-
         # Prepare response
         response_data = {
             "success": "error" not in analysis_result,
@@ -3243,6 +3271,60 @@ async def analyze_with_specialized_agent(request: SpecializedAgentRequest):
             }
         )
 
+@app.post("/api/specialized/analyze_batch")
+async def analyze_batch_with_specialized_agents(request: SpecializedBatchRequest):
+    """Analyze several legal cases with specialized agents in one request"""
+    try:
+        start_time = datetime.now()
+
+        if not SPECIALIZED_AGENTS_AVAILABLE:
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "success": False,
+                    "message": "Specialized agents not available",
+                    "error": "Specialized agent system not initialized"
+                }
+            )
+
+        router = get_agent_router()
+
+        # All items are routed concurrently, each distinct query once
+        analysis_results = await router.route_queries_async(
+            [(item.query, item.case_type) for item in request.items]
+        )
+
+        results = []
+        for item, analysis_result in zip(request.items, analysis_results):
+            results.append({
+                "success": "error" not in analysis_result,
+                "data": analysis_result,
+                "session_id": record_specialized_analysis(item, analysis_result)
+            })
+
+        response_data = {
+            "success": all(result["success"] for result in results),
+            "results": results,
+            "message": f"Specialized agent analysis completed for {len(results)} queries",
+            "processing_time": (datetime.now() - start_time).total_seconds(),
+            "timestamp": datetime.now().isoformat()
+        }
+
+        logger.info(f"Specialized agent batch analysis completed for {len(results)} queries")
+        return JSONResponse(content=response_data)
+
+    except Exception as e:
+        logger.error(f"Error in specialized agent batch analysis: {str(e)}")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "success": False,
+                "message": f"Specialized agent batch analysis error: {str(e)}",
+                "error": str(e),
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+
 @app.post("/api/specialized/routing-recommendations")
 async def get_routing_recommendations(request: AgentRoutingRequest):
     """Get routing recommendations for query analysis"""
@@ -3353,7 +3435,7 @@ async def analyze_with_general_agent(request: SpecializedAgentRequest):
             session_id = request.session_id
 
         # Analyze with general agent
-        analysis_result = general_agent.analyze_case(request.query, request.case_type or "General Legal Matter")
+        analysis_result = await run_in_threadpool(general_agent.analyze_case, request.query, request.case_type or "General Legal Matter")
 
         # Get routing recommendations
         routing_recommendations = router.get_routing_recommendations(request.query)
@@ -4012,7 +4094,7 @@ async def process_simple_message(request: SimpleMessageRequest):
             try:
                 router = get_agent_router()
                 general_agent = router.get_general_agent()
-                analysis_result = general_agent.analyze_case(request.message, "General Legal Matter")
+                analysis_result = await run_in_threadpool(general_agent.analyze_case, request.message, "General Legal Matter")
 
                 # Get routing recommendations
                 routing_recommendations = router.get_routing_recommendations(request.message)
@@ -4124,7 +4206,7 @@ async def analyze_with_flexible_input(request: dict):
             try:
                 router = get_agent_router()
                 general_agent = router.get_general_agent()
-                analysis_result = general_agent.analyze_case(query, case_type)
+                analysis_result = await run_in_threadpool(general_agent.analyze_case, query, case_type)
 
                 # Get routing recommendations
                 routing_recommendations = router.get_routing_recommendations(query)
@@ -4227,7 +4309,7 @@ async def specialized_agent_analysis(request: SpecializedAgentRequest):
                 category, agent, confidence = router.select_best_agent(request.query, request.case_type)
 
                 # Get professional analysis using NVIDIA API
-                analysis_result = agent.analyze_case(request.query, request.case_type or "General Legal Matter")
+                analysis_result = await run_in_threadpool(agent.analyze_case, request.query, request.case_type or "General Legal Matter")
 
                 # Add routing information
                 analysis_result["routing_info"] = {
@@ -4244,7 +4326,7 @@ async def specialized_agent_analysis(request: SpecializedAgentRequest):
                 # Fallback to general agent
                 router = get_agent_router()
                 general_agent = router.get_general_agent()
-                analysis_result = general_agent.analyze_case(request.query, request.case_type or "General Legal Matter")
+                analysis_result = await run_in_threadpool(general_agent.analyze_case, request.query, request.case_type or "General Legal Matter")
                 analysis_result["routing_info"] = {
                     "selected_agent": "General Legal Agent (Fallback)",
                     "agent_category": "general",
@@ -4339,7 +4421,7 @@ async def detailed_legal_analysis(request: SpecializedAgentRequest):
                 category, agent, confidence = router.select_best_agent(request.query, request.case_type)
 
                 # Get comprehensive analysis using NVIDIA API
-                analysis_result = agent.analyze_case(request.query, request.case_type or "Legal Matter")
+                analysis_result = await run_in_threadpool(agent.analyze_case, request.query, request.case_type or "Legal Matter")
 
                 # Add routing information
                 analysis_result["routing_info"] = {
@@ -4356,7 +4438,7 @@ async def detailed_legal_analysis(request: SpecializedAgentRequest):
                 # Fallback to general agent
                 router = get_agent_router()
                 general_agent = router.get_general_agent()
-                analysis_result = general_agent.analyze_case(request.query, request.case_type or "Legal Matter")
+                analysis_result = await run_in_threadpool(general_agent.analyze_case, request.query, request.case_type or "Legal Matter")
                 analysis_result["routing_info"] = {
                     "selected_agent": "General Legal Agent (Fallback)",
                     "agent_category": "general",
@@ -4453,7 +4535,7 @@ async def test_specialized_agent(request: dict):
                 category, agent, confidence = router.select_best_agent(message, "General Legal Matter")
 
                 # Get analysis from selected agent
-                analysis_result = agent.analyze_case(message, "General Legal Matter")
+                analysis_result = await run_in_threadpool(agent.analyze_case, message, "General Legal Matter")
 
                 # Add routing information
                 if isinstance(analysis_result, dict):
@@ -3,16 +3,67 @@
 Simple test script to check if BhimLaw API is working
 """
 
-import requests
+import atexit
 import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Faster JSON encoding and decoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Every endpoint URL is derived from the server's base URL
+BASE_URL = "http://localhost:5001"
+HEALTH_URL = f"{BASE_URL}/health"
+ANALYZE_URL = f"{BASE_URL}/api/specialized/analyze"
+ANALYZE_BATCH_URL = f"{BASE_URL}/api/specialized/analyze_batch"
+
+# Seconds to wait for the health check before treating the server as down
+HEALTH_TIMEOUT = 3
+
+# Set BHIM_VERBOSE=1 to print full response headers and pretty-printed bodies
+VERBOSE = os.environ.get("BHIM_VERBOSE") == "1"
+
+# One keep-alive session for every request, so the probes share pooled connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                                     max_retries=Retry(total=3, backoff_factor=0.1)))
+SESSION.headers.update({"Content-Type": "application/json"})
+atexit.register(SESSION.close)
+
+def dumps_pretty(data):
+    """Serialize data as indented JSON text"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+def encode_body(data):
+    """Serialize a request payload once, to be posted as raw bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def loads_response(response):
+    """Decode a JSON response body"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
 
 def test_health_endpoint():
     """Test the health endpoint"""
     try:
-        response = requests.get("http://localhost:5001/health", timeout=10)
+        response = SESSION.get(HEALTH_URL, timeout=HEALTH_TIMEOUT)
         print(f"Health endpoint status: {response.status_code}")
         if response.status_code == 200:
-            print("Health endpoint response:", response.json())
+            print("Health endpoint response:", loads_response(response))
             return True
         else:
             print("Health endpoint failed:", response.text)
@@ -21,34 +72,60 @@ def test_health_endpoint():
         print(f"Health endpoint error: {e}")
         return False
 
-def test_specialized_analyze():
-    """Test the specialized analyze endpoint"""
+ANALYZE_PAYLOAD = {
+    "query": "I've inherited a property, but the mutation record hasn't been updated in my name. How do I proceed?",
+    "case_type": "property_violations",
+    "session_id": "test_session_123",
+    "force_new_session": True
+}
+
+def post_specialized_analyze():
+    """POST the sample analyze request"""
+    return SESSION.post(
+        ANALYZE_URL,
+        data=encode_body(ANALYZE_PAYLOAD),
+        timeout=30
+    )
+
+def start_specialized_analyze():
+    """Send the sample analyze request in the background, returning a future for its response
+
+    The request runs on a daemon thread, which is not joined at exit, so an
+    abandoned request cannot keep the script alive after a failed health check.
+    """
+    pending = Future()
+
+    def send():
+        try:
+            pending.set_result(post_specialized_analyze())
+        except Exception as e:
+            pending.set_exception(e)
+
+    threading.Thread(target=send, daemon=True).start()
+    return pending
+
+def test_specialized_analyze(pending=None):
+    """Test the specialized analyze endpoint
+
+    pending is an optional future from start_specialized_analyze for a request already sent.
+    """
     try:
-        url = "http://localhost:5001/api/specialized/analyze"
-        data = {
-            "query": "I've inherited a property, but the mutation record hasn't been updated in my name. How do I proceed?",
-            "case_type": "property_violations",
-            "session_id": "test_session_123",
-            "force_new_session": True
-        }
+        print(f"Testing URL: {ANALYZE_URL}")
+        print(f"Request data: {dumps_pretty(ANALYZE_PAYLOAD)}")
         
-        print(f"Testing URL: {url}")
-        print(f"Request data: {json.dumps(data, indent=2)}")
-        
-        response = requests.post(
-            url,
-            json=data,
-            headers={"Content-Type": "application/json"},
-            timeout=30
-        )
+        response = pending.result() if pending is not None else post_specialized_analyze()
         
         print(f"Response status: {response.status_code}")
-        print(f"Response headers: {dict(response.headers)}")
+        if VERBOSE:
+            print(f"Response headers: {dict(response.headers)}")
         
         if response.status_code == 200:
-            response_data = response.json()
-            print("API Response:")
-            print(json.dumps(response_data, indent=2))
+            response_data = loads_response(response)
+            if VERBOSE:
+                print("API Response:")
+                print(dumps_pretty(response_data))
+            else:
+                print(f"status={response.status_code} bytes={len(response.content)} keys={sorted(response_data)}")
             return True
         else:
             print("API Error Response:")
@@ -59,18 +136,88 @@ def test_specialized_analyze():
         print(f"API test error: {e}")
         return False
 
+# Queries for the concurrent probe, one per specialized agent domain
+PROBE_PAYLOADS = [
+    {"query": "Municipality issued a demolition notice for unauthorized construction on my plot", "case_type": "property_violations"},
+    {"query": "Garbage is being dumped and burnt near our colony causing pollution", "case_type": "environmental_health"},
+    {"query": "My promotion is pending for two years despite seniority", "case_type": "employee_services"},
+    {"query": "The PIO has not replied to my RTI application for 45 days", "case_type": "rti_transparency"},
+    {"query": "Road laying work damaged my compound wall", "case_type": "infrastructure_works"},
+    {"query": "My neighbour has encroached on public land next to my house", "case_type": "encroachment_land"},
+    {"query": "My trade license renewal was rejected without reasons", "case_type": "licensing_trade"},
+    {"query": "Our slum is being cleared without any resettlement plan", "case_type": "slum_clearance"},
+    {"query": "Contaminated water supply and drainage overflow in our street", "case_type": "water_drainage"},
+    {"query": "Loudspeaker noise from a nearby hall every night", "case_type": "public_nuisance"},
+]
+
+def _probe(case_type, body):
+    """POST one prebuilt analyze request, returning (case_type, status code or error)"""
+    try:
+        response = SESSION.post(ANALYZE_URL, data=body, timeout=60)
+        return case_type, response.status_code
+    except Exception as e:
+        return case_type, str(e)
+
+def test_specialized_analyze_concurrent(payloads=PROBE_PAYLOADS, max_workers=10):
+    """Probe the specialized analyze endpoint with several queries at once"""
+    # Bodies are encoded up front so the workers only send bytes
+    bodies = [encode_body(payload) for payload in payloads]
+
+    # The requests overlap on the pooled session instead of waiting on each other's round trips
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_probe, (payload["case_type"] for payload in payloads), bodies))
+
+    for case_type, status in results:
+        print(f"{case_type}: {status}")
+    return all(status == 200 for _, status in results)
+
+def test_specialized_analyze_batch(payloads=PROBE_PAYLOADS):
+    """Send all probe queries to the batch analyze endpoint in a single request"""
+    try:
+        response = SESSION.post(
+            ANALYZE_BATCH_URL,
+            data=encode_body({"items": payloads}),
+            timeout=120
+        )
+        print(f"Response status: {response.status_code}")
+
+        if response.status_code == 200:
+            response_data = loads_response(response)
+            for payload, result in zip(payloads, response_data["results"]):
+                print(f"{payload['case_type']}: success={result['success']}")
+            return response_data["success"]
+        else:
+            print("API Error Response:")
+            print(response.text)
+            return False
+
+    except Exception as e:
+        print(f"Batch API test error: {e}")
+        return False
+
 def main():
     print("🧪 Testing BhimLaw API...")
     print("=" * 50)
     
-    # Test health endpoint
+    # The first analyze request is sent while the health check runs; its result is
+    # only reported once the server is known to be healthy, and dropped otherwise
+    pending = start_specialized_analyze()
+
     print("\n1. Testing Health Endpoint...")
     health_ok = test_health_endpoint()
     
     if health_ok:
         print("\n2. Testing Specialized Analyze Endpoint...")
-        api_ok = test_specialized_analyze()
+        api_ok = test_specialized_analyze(pending)
         
+        if api_ok:
+            print("\n3. Probing Specialized Analyze Endpoint Concurrently...")
+            api_ok = test_specialized_analyze_concurrent()
+
+        if api_ok:
+            print("\n4. Testing Specialized Batch Analyze Endpoint...")
+            api_ok = test_specialized_analyze_batch()
+
         if api_ok:
             print("\n✅ All tests passed! BhimLaw API is working correctly.")
         else: